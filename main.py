@@ -20,6 +20,7 @@ GitHub Actions (cron)용 Notion 뉴스 자동 업로드 파이프라인 - 단일
 선택 ENV:
 - OPENAI_API_KEY (있으면 요약/용어 추출)
 - OPENAI_MODEL (기본: gpt-4o-mini)
+- NOTION_CACHE_REFRESH (1/true면 캐시된 data_source_id를 무시하고 다시 조회)
 
 고정 DB ID(요청값):
 - 뉴스 DB: 2ff62df4842180b6944df052819a8872
@@ -28,20 +29,41 @@ GitHub Actions (cron)용 Notion 뉴스 자동 업로드 파이프라인 - 단일
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import html
+import io
+import itertools
 import json
 import os
+import random
 import re
+import sqlite3
 import sys
+import threading
 import time
 import traceback
-import urllib.request
 import xml.etree.ElementTree as ET
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 stdlib json 사용
+    orjson = None
+
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # lxml 미설치 환경에서는 stdlib ElementTree로 파싱
+    _lxml_etree = None
 
 # -----------------------------
 # Config
@@ -69,9 +91,78 @@ RSS_FEEDS = [
 
 NEWS_CATEGORY_ALLOWED = {"경제", "국제", "ai", "cj"}
 
+# 피드는 최신순이므로 앞쪽 N개만 파싱하고 나머지는 읽지 않음
+RSS_MAX_ITEMS_PER_FEED = 30
+
 HTTP_TIMEOUT = 30
 NOTION_RETRY = 4
+NOTION_RELATION_LIMIT = 100  # 페이지 생성/수정 요청 한 번에 보낼 수 있는 relation 최대 개수
+NOTION_RATE_LIMIT = 3.0  # Notion 평균 허용량(초당 3회)
 OPENAI_RETRY = 3
+OPENAI_CONCURRENCY = 3
+
+# Structured Outputs: API가 스키마에 맞는 JSON만 반환하도록 강제
+OPENAI_SUMMARY_SCHEMA = {
+    "name": "news_summary",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "summary": {"type": "string"},
+            "terms": {"type": "array", "items": {"type": "string"}, "minItems": 2, "maxItems": 2},
+        },
+        "required": ["summary", "terms"],
+        "additionalProperties": False,
+    },
+}
+# 여러 기사를 한 번의 요청으로 요약할 때의 스키마. 순서가 바뀌어도 맞게 붙이도록 각 결과에 기사 번호(index)를 함께 받음
+OPENAI_BATCH_SCHEMA = {
+    "name": "news_summary_batch",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "index": {"type": "integer"},
+                        **OPENAI_SUMMARY_SCHEMA["schema"]["properties"],
+                    },
+                    "required": ["index", *OPENAI_SUMMARY_SCHEMA["schema"]["required"]],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["results"],
+        "additionalProperties": False,
+    },
+}
+BACKOFF_BASE = 0.6
+BACKOFF_CAP = 6.0
+RETRY_AFTER_MAX = 60.0
+
+# 실행 간 재사용하는 로컬 캐시 (GitHub Actions에서는 actions/cache로 보존)
+CACHE_DIR = ".cache"
+OPENAI_CACHE_PATH = os.path.join(CACHE_DIR, "openai.sqlite")
+OPENAI_CACHE_TTL = 30 * 24 * 3600  # 30일
+DS_CACHE_PATH = os.path.join(CACHE_DIR, "ds_ids.json")
+DS_CACHE_TTL = 7 * 24 * 3600  # 7일 (cron 주기(24시간)보다 충분히 길게; 잘못된 id는 첫 query 실패 시 재해석)
+NOTION_CACHE_REFRESH = os.getenv("NOTION_CACHE_REFRESH", "").strip().lower() in ("1", "true", "yes")
+RSS_CACHE_PATH = os.path.join(CACHE_DIR, "rss.json")
+
+_RE_WS = re.compile(r"\s+")
+_RE_TOKEN = re.compile(r"[A-Za-z가-힣0-9·\-]{2,}")
+_RE_NON_WORD = re.compile(r"[\W_]+")
+
+# OpenAI 미사용 시 용어 후보에서 제외할 일반어 (기사 상투어/매체명 등)
+_STOPWORDS = frozenset({
+    "경제", "국제", "뉴스", "기자", "특파원", "연합뉴스", "한국경제", "한경", "한경닷컴", "사진", "제공", "무단",
+    "전재", "배포", "금지", "이날", "지난", "올해", "내년", "작년", "오늘", "현재", "최근", "이번", "관련",
+    "대한", "위해", "통해", "따르면", "것으로", "있다", "했다", "밝혔다", "전했다", "말했다", "있는", "하는",
+    "the", "and", "for", "with", "from", "this", "that", "are", "was", "has", "have",
+})
 
 # -----------------------------
 # Expected typed schemas (핵심 수정)
@@ -104,7 +195,56 @@ def _now_utc_iso() -> str:
 
 
 def _compact(s: str, limit: int = 5000) -> str:
-    s = re.sub(r"\s+", " ", (s or "").strip())
+    s = _RE_WS.sub(" ", (s or "").strip())
+    if len(s) > limit:
+        return s[:limit] + "…"
+    return s
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_text(obj: Any) -> str:
+    return _json_dumps(obj).decode("utf-8")
+
+
+def _strip_tags(s: str) -> str:
+    # <...> 구간을 공백으로 바꿈. 정규식 대신 str.find로 앞으로만 훑어 조각을 모으므로
+    # 닫히지 않은 "<"가 많은 깨진 HTML에서도 선형 시간 (닫는 ">"가 없으면 나머지는 그대로 둠)
+    pieces = []
+    pos = 0
+    i = s.find("<")
+    while i != -1:
+        j = s.find(">", i + 1)
+        if j == -1:
+            break
+        if j > i + 1:
+            pieces.append(s[pos:i])
+            pieces.append(" ")
+            pos = j + 1
+        i = s.find("<", j + 1)
+    pieces.append(s[pos:])
+    return "".join(pieces)
+
+
+def _strip_and_compact(s: str, limit: int = 5000) -> str:
+    # HTML 태그 제거 + 공백 정리. 태그가 없는 평문이면 태그 스캔은 건너뜀
+    s = s or ""
+    if "<" in s:
+        s = _strip_tags(s)
+    if "&" in s:
+        # &nbsp; &amp; 등 HTML 엔티티 복원 (태그 제거 후에 해야 &lt;..&gt; 텍스트가 태그로 오인되지 않음)
+        s = html.unescape(s)
+    s = " ".join(s.split())
     if len(s) > limit:
         return s[:limit] + "…"
     return s
@@ -113,20 +253,17 @@ def _compact(s: str, limit: int = 5000) -> str:
 def _safe_get(d: Dict[str, Any], *keys: Any, default=None):
     cur: Any = d
     for k in keys:
-        if not isinstance(cur, dict) or k not in cur:
+        if isinstance(cur, list) and isinstance(k, int):
+            if not -len(cur) <= k < len(cur):
+                return default
+        elif not isinstance(cur, dict) or k not in cur:
             return default
         cur = cur[k]
     return cur
 
 
 def _dedupe_preserve(items: List[str]) -> List[str]:
-    seen = set()
-    out = []
-    for x in items:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+    return list(dict.fromkeys(items))
 
 
 def _parse_rfc822_date(dt_str: str) -> Optional[datetime]:
@@ -147,9 +284,94 @@ def _to_date_iso(dt: Optional[datetime]) -> str:
     return dt.date().isoformat()
 
 
-def _sleep_backoff(attempt: int):
-    base = 0.6 * (2 ** attempt)
-    time.sleep(min(6.0, base) + (0.05 * attempt))
+def _retry_after_seconds(resp: requests.Response) -> Optional[float]:
+    value = (resp.headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        dt = _parse_rfc822_date(value)  # HTTP-date 형식
+        if not dt:
+            return None
+        seconds = (dt - datetime.now(timezone.utc)).total_seconds()
+    return min(RETRY_AFTER_MAX, max(0.0, seconds))
+
+
+def _load_json_cache(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_json_cache(path: str, data: Dict[str, Any]):
+    # 캐시는 최적화일 뿐이므로 저장 실패는 경고만 출력
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps(data))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"WARN: cache write failed ({path}): {e!r}", file=sys.stderr)
+
+
+def _sleep_backoff(prev_delay: float, retry_after: Optional[float] = None) -> float:
+    # decorrelated jitter: 다른 클라이언트와 재시도 타이밍이 겹쳐 429가 반복되는 것을 방지
+    if retry_after is not None:
+        delay = retry_after
+    else:
+        delay = min(BACKOFF_CAP, random.uniform(BACKOFF_BASE, max(BACKOFF_BASE, prev_delay * 3)))
+    time.sleep(delay)
+    return delay
+
+
+# -----------------------------
+# HTTP sessions (keep-alive)
+# -----------------------------
+
+
+def _new_session(headers: Dict[str, str]) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    session.headers.update(headers)
+    return session
+
+
+class TokenBucket:
+    # 스레드 간 공유하는 토큰 버킷. 토큰이 남아 있으면 바로 통과하고, 비었을 때만 다음 토큰까지 대기
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1  # 음수면 앞선 대기자 몫까지 예약된 것
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# 호스트별로 세션을 재사용해 TCP/TLS 핸드셰이크를 한 번만 수행하고, 고정 헤더도 세션에 한 번만 설정
+_NOTION_SESSION = _new_session(
+    {
+        "Authorization": f"Bearer {NOTION_TOKEN}",
+        "Notion-Version": NOTION_VERSION,
+        "Content-Type": "application/json",
+    }
+)
+_OPENAI_SESSION = _new_session({"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"})
+_RSS_SESSION = _new_session({"User-Agent": "Mozilla/5.0"})
+_NOTION_BUCKET = TokenBucket(NOTION_RATE_LIMIT, NOTION_RATE_LIMIT)
 
 
 # -----------------------------
@@ -158,7 +380,17 @@ def _sleep_backoff(attempt: int):
 
 
 class NotionHTTPError(RuntimeError):
-    pass
+    def __init__(self, message: str, *, status: Optional[int] = None, payload: Any = None):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+        self.payload = payload
+
+    def __str__(self) -> str:
+        # 에러 payload(스키마 덤프 등)는 메시지가 실제로 필요할 때만 직렬화
+        if self.payload is None:
+            return self.message
+        return f"{self.message}: {_json_text(self.payload)}"
 
 
 def notion_request(
@@ -168,47 +400,44 @@ def notion_request(
     params: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     url = f"{NOTION_API_BASE}{path}"
-    headers = {
-        "Authorization": f"Bearer {NOTION_TOKEN}",
-        "Notion-Version": NOTION_VERSION,
-        "Content-Type": "application/json",
-    }
+    data = _json_dumps(body) if body is not None else None
 
     last_err = None
-    for attempt in range(NOTION_RETRY):
+    delay = BACKOFF_BASE
+    for _ in range(NOTION_RETRY):
+        _NOTION_BUCKET.acquire()
         try:
-            resp = requests.request(
+            resp = _NOTION_SESSION.request(
                 method=method.upper(),
                 url=url,
-                headers=headers,
-                json=body if body is not None else None,
+                data=data,
                 params=params if params is not None else None,
                 timeout=HTTP_TIMEOUT,
             )
             if 200 <= resp.status_code < 300:
-                if resp.text.strip():
-                    return resp.json()
+                if resp.content.strip():
+                    return _json_loads(resp.content)
                 return {}
 
             try:
-                err_json = resp.json()
+                err_json = _json_loads(resp.content)
             except Exception:
                 err_json = {"status": resp.status_code, "text": resp.text}
 
             # retryable
             if resp.status_code in (429, 500, 502, 503, 504):
                 last_err = err_json
-                _sleep_backoff(attempt)
+                delay = _sleep_backoff(delay, _retry_after_seconds(resp))
                 continue
 
             raise NotionHTTPError(
-                f"Notion API error {resp.status_code} {method} {path}: {json.dumps(err_json, ensure_ascii=False)}"
+                f"Notion API error {resp.status_code} {method} {path}", status=resp.status_code, payload=err_json
             )
         except (requests.Timeout, requests.ConnectionError) as e:
             last_err = {"error": str(e)}
-            _sleep_backoff(attempt)
+            delay = _sleep_backoff(delay)
 
-    raise NotionHTTPError(f"Notion API failed after retries: {json.dumps(last_err, ensure_ascii=False)}")
+    raise NotionHTTPError("Notion API failed after retries", payload=last_err)
 
 
 def notion_retrieve_database(database_id: str) -> Dict[str, Any]:
@@ -306,12 +535,43 @@ def resolve_data_source_id_by_typed_schema(database_id: str, expected_schema: Di
     ]
     raise NotionHTTPError(
         "Could not resolve a data_source_id by typed schema. "
-        f"database_id={database_id}, expected={expected_schema}, candidates={json.dumps(diag, ensure_ascii=False)}"
+        f"database_id={database_id}, expected={expected_schema}, candidates",
+        payload=diag,
     )
 
 
+def _schema_hash(expected_schema: Dict[str, str]) -> str:
+    return hashlib.md5(json.dumps(expected_schema, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def resolve_data_source_id(
+    database_id: str,
+    expected_schema: Dict[str, str],
+    *,
+    refresh: bool = False,
+) -> Tuple[str, bool]:
+    # (data_source_id, from_cache) 반환. 캐시 값은 검증 없이 쓰므로 첫 query 실패 시 refresh=True로 재해석
+    schema_hash = _schema_hash(expected_schema)
+    cache_key = f"{database_id}:{NOTION_VERSION}"  # API 버전이 바뀌면 data_source 구성도 달라질 수 있음
+    cache = _load_json_cache(DS_CACHE_PATH)
+    entry = cache.get(cache_key)
+    if (
+        not (refresh or NOTION_CACHE_REFRESH)
+        and isinstance(entry, dict)
+        and entry.get("ds_id")
+        and entry.get("schema_hash") == schema_hash
+        and time.time() - (entry.get("ts") or 0) < DS_CACHE_TTL
+    ):
+        return entry["ds_id"], True
+
+    ds_id = resolve_data_source_id_by_typed_schema(database_id, expected_schema)
+    cache[cache_key] = {"ds_id": ds_id, "schema_hash": schema_hash, "ts": int(time.time())}
+    _save_json_cache(DS_CACHE_PATH, cache)
+    return ds_id, False
+
+
 # -----------------------------
-# RSS fetch/parse (stdlib only)
+# RSS fetch/parse
 # -----------------------------
 
 
@@ -325,34 +585,97 @@ class RSSItem:
     description: str
 
 
-def fetch_rss(url: str) -> str:
-    req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-    with urllib.request.urlopen(req, timeout=HTTP_TIMEOUT) as resp:
-        data = resp.read()
-    return data.decode("utf-8", errors="replace")
+def fetch_rss(url: str, etag: str = "", last_modified: str = "") -> Tuple[Optional[str], str, str]:
+    # (xml_text, etag, last_modified) 반환. 이전 실행 이후 변경이 없으면(304) xml_text는 None
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    resp = _RSS_SESSION.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+    if resp.status_code == 304:
+        return None, etag, last_modified
+    resp.raise_for_status()
+    return (
+        resp.content.decode("utf-8", errors="replace"),
+        resp.headers.get("ETag") or "",
+        resp.headers.get("Last-Modified") or "",
+    )
+
+
+RSS_NS = {"dc": "http://purl.org/dc/elements/1.1/"}
+
+# <item> 자식 태그 -> 필드 이름 (dc:creator는 네임스페이스가 풀린 태그명으로 매칭)
+_RSS_FIELD_TAGS = {
+    "title": "title",
+    "link": "link",
+    "pubDate": "pubDate",
+    "description": "description",
+    "author": "author",
+    f"{{{RSS_NS['dc']}}}creator": "creator",
+}
+
+
+def _iter_rss_items(xml_bytes: bytes):
+    # <item>만 필요하므로 스트리밍 파싱 후 처리한 요소는 바로 비워 트리가 쌓이지 않게 함
+    if _lxml_etree is not None:
+        # fetch_rss가 이미 utf-8로 디코딩하므로 XML 선언의 encoding은 무시
+        for _, elem in _lxml_etree.iterparse(
+            io.BytesIO(xml_bytes),
+            events=("end",),
+            tag="item",
+            encoding="utf-8",
+            resolve_entities=False,
+            no_network=True,
+        ):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+
+    for _, elem in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+        if elem.tag == "item":
+            yield elem
+            elem.clear()
+
+
+def _rss_item_fields(xml_text: str) -> List[Dict[str, str]]:
+    # 필드마다 findtext/XPath로 자식을 다시 훑지 않고, 자식들을 한 번만 순회하며 필요한 태그의 텍스트를 모음
+    out: List[Dict[str, str]] = []
+    for item in itertools.islice(_iter_rss_items(xml_text.encode("utf-8")), RSS_MAX_ITEMS_PER_FEED):
+        f: Dict[str, str] = {}
+        for child in item:
+            key = _RSS_FIELD_TAGS.get(child.tag)
+            if key and key not in f:
+                f[key] = child.text or ""
+        out.append(
+            {
+                "title": f.get("title", ""),
+                "link": f.get("link", ""),
+                "pubDate": f.get("pubDate", ""),
+                "description": f.get("description", ""),
+                "author": f.get("author", "").strip() or f.get("creator", ""),
+            }
+        )
+    return out
 
 
 def parse_rss(xml_text: str, category: str) -> List[RSSItem]:
     try:
-        root = ET.fromstring(xml_text)
+        fields = _rss_item_fields(xml_text)
     except Exception:
         return []
 
-    ns = {"dc": "http://purl.org/dc/elements/1.1/"}
-
     items: List[RSSItem] = []
-    for item in root.findall(".//item"):
-        title = (item.findtext("title") or "").strip()
-        link = (item.findtext("link") or "").strip()
-        pub = _parse_rfc822_date((item.findtext("pubDate") or "").strip())
-        desc = (item.findtext("description") or "").strip()
+    for f in fields:
+        title = f["title"].strip()
+        link = f["link"].strip()
+        pub = _parse_rfc822_date(f["pubDate"].strip())
+        desc = f["description"].strip()
+        author = f["author"].strip()
 
-        author = (item.findtext("author") or "").strip()
-        if not author:
-            author = (item.findtext("dc:creator", namespaces=ns) or "").strip()
-
-        desc_plain = re.sub(r"<[^>]+>", " ", desc)
-        desc_plain = _compact(desc_plain, 1200)
+        desc_plain = _strip_and_compact(desc, 1200)
 
         if title and link:
             items.append(
@@ -368,6 +691,67 @@ def parse_rss(xml_text: str, category: str) -> List[RSSItem]:
     return items
 
 
+def _rss_item_to_json(it: RSSItem) -> Dict[str, Any]:
+    return {
+        "title": it.title,
+        "link": it.link,
+        "published": it.published.isoformat() if it.published else None,
+        "author": it.author,
+        "description": it.description,
+    }
+
+
+def _rss_item_from_json(d: Dict[str, Any], category: str) -> RSSItem:
+    published = None
+    if d.get("published"):
+        published = datetime.fromisoformat(d["published"])
+    return RSSItem(
+        title=d.get("title") or "",
+        link=d.get("link") or "",
+        published=published,
+        author=d.get("author") or "",
+        category=category,
+        description=d.get("description") or "",
+    )
+
+
+def load_rss_items(feeds: List[Tuple[str, str]]) -> List[RSSItem]:
+    # 피드 다운로드는 네트워크 대기가 대부분이므로 동시에 받고, 파싱은 피드 순서대로 처리.
+    # ETag/Last-Modified로 조건부 요청을 보내 304면 지난 실행에서 파싱해 둔 아이템을 재사용
+    if not feeds:
+        return []
+    cache = _load_json_cache(RSS_CACHE_PATH)
+
+    def fetch(url: str) -> Tuple[Optional[str], str, str]:
+        entry = cache.get(url)
+        if isinstance(entry, dict) and isinstance(entry.get("items"), list):
+            return fetch_rss(url, entry.get("etag") or "", entry.get("last_modified") or "")
+        return fetch_rss(url)
+
+    with ThreadPoolExecutor(max_workers=len(feeds)) as ex:
+        results = list(ex.map(fetch, [u for _, u in feeds]))
+
+    all_items: List[RSSItem] = []
+    for (cat, url), (xml_text, etag, last_modified) in zip(feeds, results):
+        if xml_text is None:
+            print(f"RSS not modified, reuse cached items: {url}")
+            items = [_rss_item_from_json(d, cat) for d in cache[url]["items"] if isinstance(d, dict)]
+        else:
+            items = parse_rss(xml_text, cat)
+            if etag or last_modified:
+                cache[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "items": [_rss_item_to_json(it) for it in items],
+                }
+            else:
+                cache.pop(url, None)
+        all_items.extend(items)
+
+    _save_json_cache(RSS_CACHE_PATH, cache)
+    return all_items
+
+
 # -----------------------------
 # OpenAI summarize/terms (optional)
 # -----------------------------
@@ -377,60 +761,161 @@ class OpenAIHTTPError(RuntimeError):
     pass
 
 
-def openai_chat_json(prompt: str) -> Dict[str, Any]:
+class OpenAIContentError(OpenAIHTTPError):
+    # 요청 자체는 성공했지만 응답 내용(거절/비JSON 등)을 쓸 수 없는 경우. 인증/쿼터 등 설정 오류와 구분
+    pass
+
+
+def openai_chat_json(prompt: str, json_schema: Dict[str, Any]) -> Dict[str, Any]:
     if not OPENAI_API_KEY:
         raise OpenAIHTTPError("OPENAI_API_KEY not set")
 
     url = "https://api.openai.com/v1/chat/completions"
-    headers = {"Authorization": f"Bearer {OPENAI_API_KEY}", "Content-Type": "application/json"}
     body = {
         "model": OPENAI_MODEL,
-        "messages": [
-            {"role": "system", "content": "You return ONLY valid JSON."},
-            {"role": "user", "content": prompt},
-        ],
+        "messages": [{"role": "user", "content": prompt}],
         "temperature": 0.3,
-        "response_format": {"type": "json_object"},
+        "response_format": {"type": "json_schema", "json_schema": json_schema},
     }
 
+    payload = _json_dumps(body)
+
     last_err = None
-    for attempt in range(OPENAI_RETRY):
+    delay = BACKOFF_BASE
+    for _ in range(OPENAI_RETRY):
         try:
-            resp = requests.post(url, headers=headers, json=body, timeout=HTTP_TIMEOUT)
+            resp = _OPENAI_SESSION.post(url, data=payload, timeout=HTTP_TIMEOUT)
             if 200 <= resp.status_code < 300:
-                data = resp.json()
+                data = _json_loads(resp.content)
+                refusal = _safe_get(data, "choices", 0, "message", "refusal")
+                if refusal:
+                    raise OpenAIContentError(f"OpenAI refused: {refusal}")
                 content = _safe_get(data, "choices", 0, "message", "content", default="") or ""
                 try:
-                    return json.loads(content)
+                    return _json_loads(content)
                 except Exception:
-                    raise OpenAIHTTPError(f"OpenAI returned non-JSON content: {content}")
+                    raise OpenAIContentError(f"OpenAI returned non-JSON content: {content}")
 
             try:
-                last_err = resp.json()
+                last_err = _json_loads(resp.content)
             except Exception:
                 last_err = {"status": resp.status_code, "text": resp.text}
 
             if resp.status_code in (429, 500, 502, 503, 504):
-                _sleep_backoff(attempt)
+                delay = _sleep_backoff(delay, _retry_after_seconds(resp))
                 continue
 
-            raise OpenAIHTTPError(f"OpenAI error {resp.status_code}: {json.dumps(last_err, ensure_ascii=False)}")
+            raise OpenAIHTTPError(f"OpenAI error {resp.status_code}: {_json_text(last_err)}")
         except (requests.Timeout, requests.ConnectionError) as e:
             last_err = {"error": str(e)}
-            _sleep_backoff(attempt)
+            delay = _sleep_backoff(delay)
+
+    raise OpenAIHTTPError(f"OpenAI failed after retries: {_json_text(last_err)}")
+
 
-    raise OpenAIHTTPError(f"OpenAI failed after retries: {json.dumps(last_err, ensure_ascii=False)}")
+def _openai_cache_key(title: str, url: str, snippet: str) -> str:
+    return hashlib.md5(f"{OPENAI_MODEL}|{title}|{url}|{snippet}".encode("utf-8")).hexdigest()
+
+
+def _openai_title_cache_key(title: str) -> Optional[str]:
+    # URL(추적 파라미터 등)만 다른 같은 기사도 재사용하도록 정규화한 제목으로 보조 키 생성
+    norm = _RE_NON_WORD.sub("", title.lower())
+    if not norm:
+        return None
+    digest = hashlib.blake2b(f"{OPENAI_MODEL}|{norm}".encode("utf-8"), digest_size=16).hexdigest()
+    return f"title:{digest}"
+
+
+def _openai_cache_connect() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(OPENAI_CACHE_PATH), exist_ok=True)
+    conn = sqlite3.connect(OPENAI_CACHE_PATH)
+    conn.execute("CREATE TABLE IF NOT EXISTS summaries (key TEXT PRIMARY KEY, summary TEXT, terms TEXT, ts INTEGER)")
+    return conn
+
+
+def openai_cache_get(keys: List[str]) -> Optional[Tuple[str, List[str]]]:
+    # 앞쪽 키부터 조회해 처음 맞는 항목 반환.
+    # 캐시는 최적화일 뿐이므로 읽기/쓰기 실패는 무시하고 OpenAI 호출로 진행
+    try:
+        with closing(_openai_cache_connect()) as conn:
+            for key in keys:
+                row = conn.execute(
+                    "SELECT summary, terms FROM summaries WHERE key = ? AND ts >= ?",
+                    (key, int(time.time()) - OPENAI_CACHE_TTL),
+                ).fetchone()
+                if not row:
+                    continue
+                terms = _json_loads(row[1])
+                if isinstance(terms, list):
+                    return row[0], [str(t) for t in terms]
+        return None
+    except (sqlite3.Error, OSError, ValueError):
+        return None
+
+
+def openai_cache_put(keys: List[str], summary: str, terms: List[str]):
+    terms_json = _json_text(terms)
+    now = int(time.time())
+    try:
+        with closing(_openai_cache_connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO summaries (key, summary, terms, ts) VALUES (?, ?, ?, ?)",
+                [(key, summary, terms_json, now) for key in keys],
+            )
+    except (sqlite3.Error, OSError) as e:
+        print(f"WARN: OpenAI cache write failed: {e!r}", file=sys.stderr)
+
+
+def _local_summary_and_terms(title: str, snippet: str) -> Tuple[str, List[str]]:
+    summary = _compact(snippet, 300) or _compact(title, 300)
+    counts = Counter(
+        t for t in _RE_TOKEN.findall(f"{title} {snippet}") if t.lower() not in _STOPWORDS and not t.isdigit()
+    )
+    # 빈도순, 동률이면 먼저 등장한(제목 쪽) 토큰 우선
+    terms = [t for t, _ in counts.most_common(2)]
+    while len(terms) < 2:
+        terms.append("핵심용어")
+    return summary, terms[:2]
+
+
+def _openai_cache_keys(title: str, url: str, snippet: str) -> List[str]:
+    cache_keys = [_openai_cache_key(title, url, snippet)]
+    title_key = _openai_title_cache_key(title)
+    if title_key:
+        cache_keys.append(title_key)
+    return cache_keys
+
+
+def _openai_summary_from_output(out: Dict[str, Any], title: str, snippet: str) -> Tuple[str, List[str]]:
+    summary = _compact(str(out.get("summary", "") or ""), 600) or (_compact(snippet, 300) or _compact(title, 300))
+
+    terms_raw = out.get("terms") or []
+    if not isinstance(terms_raw, list):
+        terms_raw = []
+    terms = _dedupe_preserve([_compact(str(t or ""), 60) for t in terms_raw if str(t or "").strip()])[:2]
+    while len(terms) < 2:
+        terms.append("핵심용어")
+    return summary, terms[:2]
+
+
+_OPENAI_REQUIREMENTS = """
+요구사항:
+1) summary: 2~3문장 한국어 요약(과장 금지, 불확실하면 "~로 전해졌다" 등).
+2) terms: 핵심 용어 2개
+   - 사람 이름만 2개 금지
+   - 너무 일반적인 단어 금지
+   - 명사/개념/기업/정책/기술 위주
+""".strip()
 
 
 def summarize_and_extract_terms(title: str, url: str, snippet: str, category: str) -> Tuple[str, List[str]]:
     if not OPENAI_API_KEY:
-        summary = _compact(snippet, 300) or _compact(title, 300)
-        toks = re.findall(r"[A-Za-z가-힣0-9·\-]{2,}", f"{title} {snippet}")
-        toks = _dedupe_preserve([t for t in toks if len(t) >= 2])
-        terms = [t for t in toks[:2] if t.strip()]
-        while len(terms) < 2:
-            terms.append("핵심용어")
-        return summary, terms[:2]
+        return _local_summary_and_terms(title, snippet)
+
+    cache_keys = _openai_cache_keys(title, url, snippet)
+    cached = openai_cache_get(cache_keys)
+    if cached:
+        return cached
 
     prompt = f"""
 다음은 한국경제 RSS 기사 정보다.
@@ -440,31 +925,84 @@ def summarize_and_extract_terms(title: str, url: str, snippet: str, category: st
 - URL: {url}
 - RSS 요약/설명(참고): {snippet}
 
-요구사항:
-1) 2~3문장 한국어 요약(과장 금지, 불확실하면 "~로 전해졌다" 등).
-2) 핵심 용어 2개:
-   - 사람 이름만 2개 금지
-   - 너무 일반적인 단어 금지
-   - 명사/개념/기업/정책/기술 위주
-
-아래 JSON만 출력:
-{{
-  "summary": "요약(2~3문장)",
-  "terms": ["용어1","용어2"]
-}}
+{_OPENAI_REQUIREMENTS}
 """.strip()
 
-    out = openai_chat_json(prompt)
-    summary = _compact(str(out.get("summary", "") or ""), 600) or (_compact(snippet, 300) or _compact(title, 300))
+    try:
+        out = openai_chat_json(prompt, OPENAI_SUMMARY_SCHEMA)
+    except OpenAIContentError as e:
+        # 모델이 거절했거나 응답을 해석할 수 없을 때만 로컬 요약/용어로 대체 (캐시에는 저장하지 않음).
+        # 인증/쿼터/요청 오류는 그대로 올려 해당 기사를 에러로 처리 (run 실패로 드러나도록)
+        print(f"OpenAI summary failed, use local fallback: {title} ({e})", file=sys.stderr)
+        return _local_summary_and_terms(title, snippet)
+    summary, terms = _openai_summary_from_output(out, title, snippet)
+    openai_cache_put(cache_keys, summary, terms)
+    return summary, terms
+
+
+def openai_batch_summary_and_terms(items: List[RSSItem]) -> List[Tuple[str, List[str]]]:
+    # 캐시에 없는 기사들을 한 번의 요청으로 요약 (결과는 items와 같은 순서로 반환)
+    blocks = []
+    for i, it in enumerate(items, 1):
+        blocks.append(
+            f"[기사 {i}]\n- 카테고리: {it.category}\n- 제목: {it.title}\n- URL: {it.link}\n- RSS 요약/설명(참고): {it.description}"
+        )
+    joined = "\n\n".join(blocks)
+    prompt = f"""
+다음은 한국경제 RSS 기사 {len(items)}개의 정보다.
 
-    terms_raw = out.get("terms") or []
-    if not isinstance(terms_raw, list):
-        terms_raw = []
-    terms = _dedupe_preserve([_compact(str(t or ""), 60) for t in terms_raw if str(t or "").strip()])[:2]
-    while len(terms) < 2:
-        terms.append("핵심용어")
+{joined}
 
-    return summary, terms[:2]
+각 기사마다 아래 요구사항대로 작성해 results 배열에 {len(items)}개를 담아라.
+index에는 해당 기사의 번호([기사 N]의 N)를 넣어라.
+
+{_OPENAI_REQUIREMENTS}
+""".strip()
+
+    out = openai_chat_json(prompt, OPENAI_BATCH_SCHEMA)
+    results = out.get("results")
+    by_index: Dict[int, Dict[str, Any]] = {}
+    for res in results if isinstance(results, list) else []:
+        idx = res.get("index") if isinstance(res, dict) else None
+        if isinstance(idx, int) and 1 <= idx <= len(items) and idx not in by_index:
+            by_index[idx] = res
+        else:
+            by_index.clear()
+            break
+    if len(by_index) != len(items) or len(results) != len(items):
+        # 번호가 빠지거나 겹치면 어떤 결과가 어느 기사 것인지 믿을 수 없으므로 배치 전체를 버림
+        raise OpenAIContentError(f"OpenAI batch results do not cover items 1..{len(items)} exactly once")
+
+    summarized = []
+    for i, it in enumerate(items, 1):
+        summary, terms = _openai_summary_from_output(by_index[i], it.title, it.description)
+        openai_cache_put(_openai_cache_keys(it.title, it.link, it.description), summary, terms)
+        summarized.append((summary, terms))
+    return summarized
+
+
+def summarize_items(items: List[RSSItem]) -> Dict[str, Tuple[str, List[str]]]:
+    # link -> (summary, terms). 캐시에 있는 건 그대로 쓰고 나머지는 한 번에 일괄 요약.
+    # 일괄 응답 내용을 쓸 수 없으면 해당 기사들은 결과에서 빠지고 호출 측에서 기사별로 다시 요약한다.
+    # 인증/쿼터 등 HTTP 오류는 기사별로 재시도해도 같으므로 그대로 올림
+    if not OPENAI_API_KEY:
+        return {it.link: _local_summary_and_terms(it.title, it.description) for it in items}
+
+    done: Dict[str, Tuple[str, List[str]]] = {}
+    misses: List[RSSItem] = []
+    for it in items:
+        cached = openai_cache_get(_openai_cache_keys(it.title, it.link, it.description))
+        if cached:
+            done[it.link] = cached
+        else:
+            misses.append(it)
+
+    if len(misses) > 1:
+        try:
+            done.update(zip((it.link for it in misses), openai_batch_summary_and_terms(misses)))
+        except OpenAIContentError as e:
+            print(f"OpenAI batch summary unusable, fall back to per-item requests: {e!r}", file=sys.stderr)
+    return done
 
 
 # -----------------------------
@@ -501,57 +1039,159 @@ def prop_relation(ids: List[str]) -> Dict[str, Any]:
 # -----------------------------
 
 
-def notion_find_news_by_url(news_data_source_id: str, url: str) -> Optional[str]:
-    filter_obj = {"property": "url", "url": {"equals": url}}
-    res = notion_query_data_source(news_data_source_id, filter_obj=filter_obj, page_size=1)
-    results = res.get("results") or []
-    if results:
-        return results[0].get("id")
-    return None
-
-
-def notion_find_term_page(term_data_source_id: str, term: str) -> Optional[str]:
-    filter_obj = {"property": "용어", "title": {"equals": term}}
-    res = notion_query_data_source(term_data_source_id, filter_obj=filter_obj, page_size=1)
-    results = res.get("results") or []
-    if results:
-        return results[0].get("id")
-    return None
-
-
-def notion_get_existing_relation_ids(page_obj: Dict[str, Any], relation_prop_name: str) -> List[str]:
-    rel = _safe_get(page_obj, "properties", relation_prop_name, "relation", default=[])
+def notion_query_all(data_source_id: str, filter_obj: Dict[str, Any]) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    cursor: Optional[str] = None
+    while True:
+        res = notion_query_data_source(data_source_id, filter_obj=filter_obj, page_size=100, start_cursor=cursor)
+        results.extend(res.get("results") or [])
+        cursor = res.get("next_cursor")
+        if not res.get("has_more") or not cursor:
+            return results
+
+
+def _plain_title(page_obj: Dict[str, Any], title_prop_name: str) -> str:
+    parts = _safe_get(page_obj, "properties", title_prop_name, "title", default=[]) or []
+    return "".join((p.get("plain_text") or "") for p in parts if isinstance(p, dict))
+
+
+def notion_find_news_by_urls(news_data_source_id: str, urls: List[str]) -> Dict[str, str]:
+    # URL마다 query를 보내지 않고 or 필터 한 번으로 이미 저장된 기사를 조회 (url -> page_id)
+    urls = _dedupe_preserve([u for u in urls if u])
+    if not urls:
+        return {}
+    filter_obj = {"or": [{"property": "url", "url": {"equals": u}} for u in urls]}
+    found: Dict[str, str] = {}
+    for page in notion_query_all(news_data_source_id, filter_obj):
+        u = _safe_get(page, "properties", "url", "url")
+        if u and page.get("id"):
+            found.setdefault(u, page["id"])
+    return found
+
+
+def notion_find_term_pages(term_data_source_id: str, terms: List[str]) -> Dict[str, Dict[str, Any]]:
+    # 용어들도 or 필터 한 번으로 조회 (term -> page). query 결과에 properties(관련 기사 포함)가 있어 재조회 불필요
+    terms = _dedupe_preserve([t for t in terms if t])
+    if not terms:
+        return {}
+    filter_obj = {"or": [{"property": "용어", "title": {"equals": t}} for t in terms]}
+    by_title: Dict[str, Dict[str, Any]] = {}
+    for page in notion_query_all(term_data_source_id, filter_obj):
+        if page.get("id"):
+            by_title.setdefault(_plain_title(page, "용어"), page)
+
+    by_folded = {}
+    for title, page in by_title.items():
+        by_folded.setdefault(title.casefold(), page)
+
+    found: Dict[str, Dict[str, Any]] = {}
+    for t in terms:
+        page = by_title.get(t) or by_folded.get(t.casefold())
+        if page:
+            found[t] = page
+    return found
+
+
+def notion_retrieve_relation(page_id: str, property_id: str) -> List[Dict[str, str]]:
+    ids: List[str] = []
+    cursor: Optional[str] = None
+    while True:
+        params: Dict[str, Any] = {"page_size": 100}
+        if cursor:
+            params["start_cursor"] = cursor
+        res = notion_request("GET", f"/pages/{page_id}/properties/{property_id}", params=params)
+        for item in res.get("results") or []:
+            rid = _safe_get(item, "relation", "id")
+            if rid:
+                ids.append(rid)
+        cursor = res.get("next_cursor")
+        if not res.get("has_more") or not cursor:
+            return [{"id": i} for i in _dedupe_preserve(ids)]
+
+
+def notion_get_existing_relation(page_obj: Dict[str, Any], relation_prop_name: str) -> List[Dict[str, str]]:
+    # PATCH 페이로드에 그대로 쓸 수 있는 [{"id": ...}] 형태로 반환
+    prop = _safe_get(page_obj, "properties", relation_prop_name, default={}) or {}
+    if prop.get("has_more") and prop.get("id") and page_obj.get("id"):
+        # page 객체의 relation은 최대 25개까지만 포함되므로 전체 목록은 property item API로 조회
+        return notion_retrieve_relation(page_obj["id"], prop["id"])
+    rel = prop.get("relation", [])
     if not isinstance(rel, list):
         return []
-    ids = []
-    for x in rel:
-        pid = x.get("id") if isinstance(x, dict) else None
-        if pid:
-            ids.append(pid)
-    return _dedupe_preserve(ids)
+    return [{"id": x["id"]} for x in rel if isinstance(x, dict) and x.get("id")]
 
 
-def upsert_term_and_link(term_data_source_id: str, term: str, news_page_id: str):
-    existing_id = notion_find_term_page(term_data_source_id, term)
-    if not existing_id:
+def upsert_term_and_link(
+    term_data_source_id: str,
+    term: str,
+    news_page_ids: List[str],
+    existing_page: Optional[Dict[str, Any]],
+) -> str:
+    if not existing_page:
         props = {
             "용어": prop_title(term),
             "의미": prop_rich_text(""),
-            "관련 기사": prop_relation([news_page_id]),
+            "관련 기사": prop_relation(news_page_ids),
         }
         created = notion_create_page(term_data_source_id, props)
-        print(f"TERM created: {term} -> {created.get('id')}")
-        return
-
-    page = notion_retrieve_page(existing_id)
-    existing_rel = notion_get_existing_relation_ids(page, "관련 기사")
-    if news_page_id in existing_rel:
-        print(f"TERM exists (already linked): {term} -> {existing_id}")
-        return
+        return f"TERM created: {term} -> {created.get('id')}"
+
+    existing_id = existing_page["id"]
+    # Notion API에는 relation 부분 추가(append) 연산이 없어 전체 목록을 보내야 하므로,
+    # 기존 [{"id"}] 목록을 재구성하지 않고 새 항목만 덧붙여 그대로 PATCH
+    relation = notion_get_existing_relation(existing_page, "관련 기사")
+    linked = {r["id"] for r in relation}
+    new_ids = [i for i in news_page_ids if i not in linked]
+    if not new_ids:
+        return f"TERM exists (already linked): {term} -> {existing_id}"
+
+    if len(relation) + len(new_ids) > NOTION_RELATION_LIMIT:
+        # 전체 목록을 보내야 하므로 한도를 넘으면 400으로 매 실행 실패하게 됨 -> 연결을 건너뛰고 경고만 남김
+        return (
+            f"WARN: TERM relation limit reached ({len(relation)} linked, limit {NOTION_RELATION_LIMIT}), "
+            f"skip linking: {term} -> {existing_id}"
+        )
+
+    relation.extend({"id": i} for i in new_ids)
+    notion_update_page(existing_id, {"관련 기사": {"relation": relation}})
+    return f"TERM updated (linked): {term} -> {existing_id}"
+
+
+def upsert_terms_and_link(
+    term_data_source_id: str,
+    term_links: Dict[str, List[str]],
+    term_pages: Dict[str, Dict[str, Any]],
+) -> int:
+    # term_links: 용어 -> 이번 실행에서 연결할 뉴스 페이지 id 목록 (기사 전체를 모은 것).
+    # "AI"/"ai"처럼 다른 키가 같은 페이지로 해석될 수 있으므로 대상 페이지(신규 용어는 casefold) 기준으로 묶어
+    # 페이지마다 한 번만 생성/PATCH 하고 (마지막 PATCH가 앞선 연결을 덮어쓰지 않도록), 서로 다른 페이지는 동시에 처리.
+    # 로그는 입력 순서대로 출력하고 실패한 용어 수를 반환
+    if not term_links:
+        return 0
+    groups: Dict[str, Tuple[str, List[str]]] = {}
+    for t, ids in term_links.items():
+        page = term_pages.get(t)
+        key = f"page:{page['id']}" if page else f"new:{t.casefold()}"
+        if key in groups:
+            groups[key] = (groups[key][0], _dedupe_preserve(groups[key][1] + ids))
+        else:
+            groups[key] = (t, list(ids))
 
-    merged = existing_rel + [news_page_id]
-    notion_update_page(existing_id, {"관련 기사": prop_relation(merged)})
-    print(f"TERM updated (linked): {term} -> {existing_id}")
+    errors = 0
+    with ThreadPoolExecutor(max_workers=min(len(groups), 8)) as ex:
+        futures = [
+            (t, ex.submit(upsert_term_and_link, term_data_source_id, t, ids, term_pages.get(t)))
+            for t, ids in groups.values()
+        ]
+        for t, f in futures:
+            try:
+                print(f.result())
+            except Exception as e:
+                errors += 1
+                print(f"ERROR linking term: {t}", file=sys.stderr)
+                print(repr(e), file=sys.stderr)
+                print(traceback.format_exc(), file=sys.stderr)
+    return errors
 
 
 # -----------------------------
@@ -559,87 +1199,144 @@ def upsert_term_and_link(term_data_source_id: str, term: str, news_page_id: str)
 # -----------------------------
 
 
-def main():
-    print(f"[{_now_utc_iso()}] Start pipeline")
+def create_news_item(
+    news_data_source_id: str,
+    it: RSSItem,
+    summarized: Optional[Tuple[str, List[str]]] = None,
+) -> Tuple[str, List[str]]:
+    summary, terms = summarized or summarize_and_extract_terms(
+        title=it.title,
+        url=it.link,
+        snippet=it.description,
+        category=it.category,
+    )
+    term_str = ", ".join(terms[:2])
+
+    publish_date_iso = _to_date_iso(it.published)
+
+    news_props = {
+        "게시일": prop_date(publish_date_iso),
+        "제목": prop_title(it.title),
+        "작성자": prop_rich_text(it.author),
+        "카테고리": prop_select(it.category),
+        "요약": prop_rich_text(summary),
+        "url": prop_url(it.link),
+        "용어": prop_rich_text(term_str),
+    }
 
-    # 1) Resolve correct data_source_id (typed schema)
-    news_ds_id = resolve_data_source_id_by_typed_schema(NEWS_DATABASE_ID, NEWS_SCHEMA)
-    term_ds_id = resolve_data_source_id_by_typed_schema(TERMS_DATABASE_ID, TERMS_SCHEMA)
-    print(f"Resolved news_data_source_id={news_ds_id}")
-    print(f"Resolved term_data_source_id={term_ds_id}")
+    created_news = notion_create_page(news_data_source_id, news_props)
+    news_page_id = created_news.get("id")
+    if not news_page_id:
+        raise NotionHTTPError("News page create returned no id", payload=created_news)
+    return news_page_id, terms
 
-    # 2) Fetch RSS items
-    all_items: List[RSSItem] = []
-    for cat, feed_url in RSS_FEEDS:
-        if cat not in NEWS_CATEGORY_ALLOWED:
-            continue
-        xml_text = fetch_rss(feed_url)
-        items = parse_rss(xml_text, cat)
-        all_items.extend(items)
 
-    all_items.sort(key=lambda x: x.published or datetime.now(timezone.utc), reverse=True)
+def main():
+    print(f"[{_now_utc_iso()}] Start pipeline")
 
-    picked: List[RSSItem] = []
-    seen_links = set()
-    for it in all_items:
-        if it.link in seen_links:
-            continue
-        seen_links.add(it.link)
-        picked.append(it)
-        if len(picked) >= 3:
-            break
+    # 1) Fetch RSS items
+    feeds = [(cat, feed_url) for cat, feed_url in RSS_FEEDS if cat in NEWS_CATEGORY_ALLOWED]
+    all_items = load_rss_items(feeds)
+
+    # 링크별로 가장 최신 항목만 남긴 뒤 전체 정렬 없이 상위 3개만 선택 (게시일 없는 항목은 현재 시각으로 간주)
+    now = datetime.now(timezone.utc)
+    # (동률이면 먼저 수집된 항목 우선)
+    newest_by_link: Dict[str, Tuple[datetime, int, RSSItem]] = {}
+    for idx, it in enumerate(all_items):
+        published = it.published or now
+        cur = newest_by_link.get(it.link)
+        if cur is None or published > cur[0]:
+            newest_by_link[it.link] = (published, -idx, it)
+    picked: List[RSSItem] = [t[2] for t in heapq.nlargest(3, newest_by_link.values(), key=lambda t: t[:2])]
 
     print(f"Picked {len(picked)} items")
+    if not picked:
+        print(f"[{_now_utc_iso()}] Summary: created=0, skipped=0, errors=0")
+        print(f"[{_now_utc_iso()}] Done")
+        return
+
+    # 2) Resolve correct data_source_id (typed schema). 용어 DB는 새 기사가 생겨 연결할 용어가 있을 때만 해석
+    news_ds_id, news_ds_cached = resolve_data_source_id(NEWS_DATABASE_ID, NEWS_SCHEMA)
+    print(f"Resolved news_data_source_id={news_ds_id}" + (" (cached)" if news_ds_cached else ""))
 
     # 3) Process items (에러가 하나라도 있으면 마지막에 실패 처리)
     errors = 0
     created_count = 0
     skipped_count = 0
 
+    picked_urls = [it.link for it in picked]
+    try:
+        existing_news = notion_find_news_by_urls(news_ds_id, picked_urls)
+    except NotionHTTPError:
+        if not news_ds_cached:
+            raise
+        # 캐시된 data_source_id가 더 이상 맞지 않으면 스키마로 다시 찾아 재시도
+        news_ds_id, news_ds_cached = resolve_data_source_id(NEWS_DATABASE_ID, NEWS_SCHEMA, refresh=True)
+        print(f"Re-resolved news_data_source_id={news_ds_id}")
+        existing_news = notion_find_news_by_urls(news_ds_id, picked_urls)
+
+    new_items: List[RSSItem] = []
     for it in picked:
-        try:
-            existing_news_id = notion_find_news_by_url(news_ds_id, it.link)
-            if existing_news_id:
-                skipped_count += 1
-                print(f"NEWS exists, skip: {it.link} ({existing_news_id})")
-                continue
-
-            summary, terms = summarize_and_extract_terms(
-                title=it.title,
-                url=it.link,
-                snippet=it.description,
-                category=it.category,
-            )
-            term_str = ", ".join(terms[:2])
-
-            publish_date_iso = _to_date_iso(it.published)
-
-            news_props = {
-                "게시일": prop_date(publish_date_iso),
-                "제목": prop_title(it.title),
-                "작성자": prop_rich_text(it.author),
-                "카테고리": prop_select(it.category),
-                "요약": prop_rich_text(summary),
-                "url": prop_url(it.link),
-                "용어": prop_rich_text(term_str),
-            }
-
-            created_news = notion_create_page(news_ds_id, news_props)
-            news_page_id = created_news.get("id")
-            if not news_page_id:
-                raise NotionHTTPError(f"News page create returned no id: {created_news}")
-
-            created_count += 1
-            print(f"NEWS created: {it.title} -> {news_page_id}")
+        existing_news_id = existing_news.get(it.link)
+        if existing_news_id:
+            skipped_count += 1
+            print(f"NEWS exists, skip: {it.link} ({existing_news_id})")
+            continue
+        new_items.append(it)
 
-            for t in terms[:2]:
-                t = (t or "").strip()
-                if t:
-                    upsert_term_and_link(term_ds_id, t, news_page_id)
+    # 요약(OpenAI)은 캐시 미스 기사를 한 번의 요청으로 일괄 처리하고, 뉴스 페이지 생성은 동시에 처리
+    # (일괄 요약에서 빠진 기사는 create_news_item 안에서 기사별로 요약)
+    try:
+        summaries = summarize_items(new_items)
+    except OpenAIHTTPError as e:
+        # 인증/쿼터 등 요약 자체가 불가능한 오류: 플레이스홀더 요약으로 저장하지 않고 이번 기사들은 모두 에러 처리
+        errors += len(new_items)
+        print("ERROR summarizing items", file=sys.stderr)
+        print(repr(e), file=sys.stderr)
+        print(traceback.format_exc(), file=sys.stderr)
+        summaries, new_items = {}, []
+    created_terms: Dict[str, Tuple[str, List[str]]] = {}
+    with ThreadPoolExecutor(max_workers=OPENAI_CONCURRENCY) as ex:
+        futures = {ex.submit(create_news_item, news_ds_id, it, summaries.get(it.link)): it for it in new_items}
+        for fut in as_completed(futures):
+            it = futures[fut]
+            try:
+                news_page_id, terms = fut.result()
+                created_count += 1
+                print(f"NEWS created: {it.title} -> {news_page_id}")
+                created_terms[it.link] = (news_page_id, terms)
+            except Exception as e:
+                errors += 1
+                print(f"ERROR processing item: {it.link}", file=sys.stderr)
+                print(repr(e), file=sys.stderr)
+                print(traceback.format_exc(), file=sys.stderr)
+
+    # 4) 용어 연결: 모든 기사의 용어를 모아 한 번의 OR query로 조회한 뒤, 용어별로 생성/PATCH
+    term_links: Dict[str, List[str]] = {}
+    for it in new_items:
+        if it.link not in created_terms:
+            continue
+        news_page_id, terms = created_terms[it.link]
+        for t in _dedupe_preserve([t for t in ((t or "").strip() for t in terms[:2]) if t]):
+            term_links.setdefault(t, []).append(news_page_id)
 
+    if term_links:
+        try:
+            term_ds_id, term_ds_cached = resolve_data_source_id(TERMS_DATABASE_ID, TERMS_SCHEMA)
+            print(f"Resolved term_data_source_id={term_ds_id}" + (" (cached)" if term_ds_cached else ""))
+            lookup_terms = list(term_links)
+            try:
+                term_pages = notion_find_term_pages(term_ds_id, lookup_terms)
+            except NotionHTTPError:
+                if not term_ds_cached:
+                    raise
+                term_ds_id, term_ds_cached = resolve_data_source_id(TERMS_DATABASE_ID, TERMS_SCHEMA, refresh=True)
+                print(f"Re-resolved term_data_source_id={term_ds_id}")
+                term_pages = notion_find_term_pages(term_ds_id, lookup_terms)
+            errors += upsert_terms_and_link(term_ds_id, term_links, term_pages)
         except Exception as e:
             errors += 1
-            print(f"ERROR processing item: {it.link}", file=sys.stderr)
+            print("ERROR linking terms", file=sys.stderr)
             print(repr(e), file=sys.stderr)
             print(traceback.format_exc(), file=sys.stderr)
 